@@ -110,11 +110,13 @@ plot_times = np.linspace(0, 1, 5)
 
 plt.figure(figsize=(15, 8))
 cmap = plt.get_cmap("inferno")
+# evaluate the numerical solution at all plot times in a single call
+T_plot = T_out(plot_times, x=x_nodes)
 for i, t in enumerate(plot_times):
     color = cmap(float(i) / len(plot_times))
     plt.plot(
         x_nodes,
-        T_out(t, x=x_nodes),
+        T_plot[:, i],
         "o",
         color=color,
         label="Numerical" if i == 0 else "",
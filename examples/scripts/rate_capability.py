@@ -1,3 +1,4 @@
+import multiprocessing
 import pybamm
 import numpy as np
 import matplotlib.pyplot as plt
@@ -7,13 +8,8 @@ pybamm.set_logging_level("INFO")
 # load model
 model = pybamm.lithium_ion.DFN()
 
-# solve model
-C_rates = np.linspace(0.05, 5, 20)
-capacities = np.zeros_like(C_rates)
-currents = np.zeros_like(C_rates)
-voltage_av = np.zeros_like(C_rates)
 
-for i, C_rate in enumerate(C_rates):
+def solve_C_rate(C_rate):
     experiment = pybamm.Experiment(
         ["Discharge at {:.4f}C until 3.2V".format(C_rate)],
         period="{:.4f} seconds".format(10 / C_rate),
@@ -21,23 +17,29 @@ for i, C_rate in enumerate(C_rates):
     sim = pybamm.Simulation(model, experiment=experiment, solver=pybamm.CasadiSolver())
     sim.solve()
 
-    time = sim.solution["Time [s]"].entries
-    capacity = sim.solution["Discharge capacity [A.h]"]
-    current = sim.solution["Current [A]"]
-    voltage = sim.solution["Terminal voltage [V]"]
+    # read the entries at the solution times directly rather than interpolating
+    capacity = sim.solution["Discharge capacity [A.h]"].entries
+    current = sim.solution["Current [A]"].entries
+    voltage = sim.solution["Terminal voltage [V]"].entries
 
-    capacities[i] = capacity(time[-1])
-    currents[i] = current(time[-1])
-    voltage_av[i] = np.mean(voltage(time))
+    return capacity[-1], current[-1], np.mean(voltage)
 
-plt.figure(1)
-plt.scatter(C_rates, capacities)
-plt.xlabel("C-rate")
-plt.ylabel("Capacity [Ah]")
 
-plt.figure(2)
-plt.scatter(currents * voltage_av, capacities * voltage_av)
-plt.xlabel("Power [W]")
-plt.ylabel("Energy [Wh]")
+if __name__ == "__main__":
+    # solve model, with each C-rate solved independently in a separate process
+    C_rates = np.linspace(0.05, 5, 20)
+    with multiprocessing.Pool() as pool:
+        results = pool.map(solve_C_rate, C_rates)
+    capacities, currents, voltage_av = np.array(results).T
 
-plt.show()
+    plt.figure(1)
+    plt.scatter(C_rates, capacities)
+    plt.xlabel("C-rate")
+    plt.ylabel("Capacity [Ah]")
+
+    plt.figure(2)
+    plt.scatter(currents * voltage_av, capacities * voltage_av)
+    plt.xlabel("Power [W]")
+    plt.ylabel("Energy [Wh]")
+
+    plt.show()
@@ -119,7 +119,13 @@ def is_matrix_x(expr, x):
                     and np.all(result.__dict__["data"] == x)
                 )
             )
-        ) or (isinstance(result, np.ndarray) and np.all(result == x))
+        ) or (
+            isinstance(result, np.ndarray)
+            # check the first entry before comparing the whole array, as most
+            # constant vectors are not uniformly equal to x
+            and (result.size == 0 or result.flat[0] == x)
+            and np.all(result == x)
+        )
     else:
         return False
 
@@ -37,7 +37,11 @@ def graphite_LGM50_electrolyte_exchange_current_density_Chen2020(
     arrhenius = pybamm.exp(E_r / pybamm.constants.R * (1 / 298.15 - 1 / T))
 
     return (
-        m_ref * arrhenius * c_e**0.5 * c_s_surf**0.5 * (c_s_max - c_s_surf) ** 0.5
+        m_ref
+        * arrhenius
+        * pybamm.sqrt(c_e)
+        * pybamm.sqrt(c_s_surf)
+        * pybamm.sqrt(c_s_max - c_s_surf)
     )
 
 
@@ -167,7 +171,11 @@ def silicon_LGM50_electrolyte_exchange_current_density_Chen2020(
     arrhenius = pybamm.exp(E_r / pybamm.constants.R * (1 / 298.15 - 1 / T))
 
     return (
-        m_ref * arrhenius * c_e**0.5 * c_s_surf**0.5 * (c_s_max - c_s_surf) ** 0.5
+        m_ref
+        * arrhenius
+        * pybamm.sqrt(c_e)
+        * pybamm.sqrt(c_s_surf)
+        * pybamm.sqrt(c_s_max - c_s_surf)
     )
 
 
@@ -238,7 +246,11 @@ def nmc_LGM50_electrolyte_exchange_current_density_Chen2020(c_e, c_s_surf, c_s_m
     arrhenius = pybamm.exp(E_r / pybamm.constants.R * (1 / 298.15 - 1 / T))
 
     return (
-        m_ref * arrhenius * c_e**0.5 * c_s_surf**0.5 * (c_s_max - c_s_surf) ** 0.5
+        m_ref
+        * arrhenius
+        * pybamm.sqrt(c_e)
+        * pybamm.sqrt(c_s_surf)
+        * pybamm.sqrt(c_s_max - c_s_surf)
     )
 
 
@@ -171,17 +171,19 @@ class BasicDFNComposite(BaseModel):
         # right side. This is also accessible via `boundary_value(x, "right")`, with
         # "left" providing the boundary value of the left side
         F_RT = param.F / (param.R * T)
+        # both phases in the negative electrode see the same potential difference
+        delta_phi_n = phi_s_n - phi_e_n
         j0_n_p1 = param.n.prim.j0(c_e_n, c_s_surf_n_p1, T)
         j_n_p1 = (
             2
             * j0_n_p1
-            * pybamm.sinh(param.n.prim.ne / 2 * F_RT * (phi_s_n - phi_e_n - ocp_n_p1))
+            * pybamm.sinh(param.n.prim.ne / 2 * F_RT * (delta_phi_n - ocp_n_p1))
         )
         j0_n_p2 = param.n.sec.j0(c_e_n, c_s_surf_n_p2, T)
         j_n_p2 = (
             2
             * j0_n_p2
-            * pybamm.sinh(param.n.sec.ne / 2 * F_RT * (phi_s_n - phi_e_n - ocp_n_p2))
+            * pybamm.sinh(param.n.sec.ne / 2 * F_RT * (delta_phi_n - ocp_n_p2))
         )
         j0_p = param.p.prim.j0(c_e_p, c_s_surf_p, T)
         a_j_s = pybamm.PrimaryBroadcast(0, "separator")
@@ -719,14 +719,12 @@ class QuickPlot(object):
                 # store the plot and the var data (for testing) as cant access
                 # z data from QuadMesh or QuadContourSet object
                 if self.is_y_z[key] is True:
-                    self.plots[key][0][0] = ax.pcolormesh(
-                        x,
-                        y,
-                        var,
-                        vmin=vmin,
-                        vmax=vmax,
-                        shading="auto",
-                    )
+                    # the y-z grid does not change with time, so update the data
+                    # of the existing mesh rather than building a new one
+                    mesh = self.plots[key][0][0]
+                    mesh.set_array(var.ravel())
+                    if (vmin, vmax) == (None, None):
+                        mesh.autoscale()
                 else:
                     self.plots[key][0][0] = ax.contourf(
                         x, y, var, levels=100, vmin=vmin, vmax=vmax
@@ -500,9 +500,11 @@ class TestIsZero(unittest.TestCase):
         a = pybamm.Matrix(np.zeros((10, 10)))
         b = pybamm.Matrix(np.ones((10, 10)))
         c = pybamm.Matrix([1, 0, 0])
+        d = pybamm.Matrix([0, 0, 1])
         self.assertTrue(pybamm.is_matrix_zero(a))
         self.assertFalse(pybamm.is_matrix_zero(b))
         self.assertFalse(pybamm.is_matrix_zero(c))
+        self.assertFalse(pybamm.is_matrix_zero(d))
 
     def test_bool(self):
         a = pybamm.Symbol("a")
@@ -2,6 +2,7 @@ import os
 import pybamm
 import unittest
 import numpy as np
+from matplotlib.collections import QuadMesh
 
 
 class TestQuickPlot(unittest.TestCase):
@@ -461,6 +462,33 @@ class TestQuickPlot(unittest.TestCase):
             ][1]
             np.testing.assert_array_almost_equal(qp_data.T, phi_n[:, :, -1])
 
+        # check the existing y-z mesh is updated in place, rather than a new mesh
+        # being added to the axes on every update
+        var = "Negative current collector potential [V]"
+        for variable_limits in ["fixed", "tight", {var: (0.1, 0.2)}]:
+            quick_plot = pybamm.QuickPlot(
+                solution, [var], variable_limits=variable_limits
+            )
+            quick_plot.plot(0)
+            mesh = quick_plot.plots[(var,)][0][0]
+            norm_limits = (mesh.norm.vmin, mesh.norm.vmax)
+            quick_plot.slider_update(t_eval[-1])
+            self.assertIs(quick_plot.plots[(var,)][0][0], mesh)
+            ax = quick_plot.axes[0]
+            self.assertEqual(sum(isinstance(c, QuadMesh) for c in ax.collections), 1)
+            np.testing.assert_array_almost_equal(
+                np.asarray(mesh.get_array()).ravel(), phi_n[:, :, -1].T.ravel()
+            )
+            if variable_limits == "tight":
+                # the colour limits follow the data at the new time
+                self.assertAlmostEqual(mesh.norm.vmin, np.min(phi_n[:, :, -1]))
+                self.assertAlmostEqual(mesh.norm.vmax, np.max(phi_n[:, :, -1]))
+            else:
+                # the colour limits stay fixed
+                self.assertEqual((mesh.norm.vmin, mesh.norm.vmax), norm_limits)
+            if isinstance(variable_limits, dict):
+                self.assertEqual(norm_limits, (0.1, 0.2))
+
         with self.assertRaisesRegex(NotImplementedError, "Shape not recognized for"):
             pybamm.QuickPlot(solution, ["Negative particle concentration [mol.m-3]"])
 